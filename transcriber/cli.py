@@ -6,7 +6,45 @@ from pathlib import Path
 from transcriber.pipeline import transcribe_media_to_outputs
 
 
-def build_parser() -> argparse.ArgumentParser:
+_PARSER: argparse.ArgumentParser | None = None
+
+
+def _parse_device_index(value: str) -> list[int]:
+    try:
+        indices = [int(part) for part in value.split(",") if part.strip()]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected a comma-separated list of integers, got {value!r}") from None
+    if not indices:
+        raise argparse.ArgumentTypeError("expected at least one device index")
+    if any(i < 0 for i in indices):
+        raise argparse.ArgumentTypeError(f"device indices must be >= 0, got {value!r}")
+    return indices
+
+
+def _positive_int(value: str) -> int:
+    try:
+        n = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected an integer, got {value!r}") from None
+    if n < 1:
+        raise argparse.ArgumentTypeError(f"must be >= 1, got {n}")
+    return n
+
+
+def build_parser(fresh: bool = False) -> argparse.ArgumentParser:
+    """
+    Return the CLI parser, built once and reused. Pass `fresh=True` for a new instance
+    (e.g. before mutating defaults).
+    """
+    global _PARSER
+    if fresh:
+        return _build_parser()
+    if _PARSER is None:
+        _PARSER = _build_parser()
+    return _PARSER
+
+
+def _build_parser() -> argparse.ArgumentParser:
     p = argparse.ArgumentParser(description="Local media → timestamped text transcriber (offline)")
     p.add_argument(
         "--input",
@@ -27,29 +65,66 @@ def build_parser() -> argparse.ArgumentParser:
     p.add_argument(
         "--compute-type",
         default=None,
-        help="Compute type (e.g. int8, float16). If omitted, picked based on device.",
+        help=(
+            "CTranslate2 compute type (e.g. int8, float16, int8_float16). If omitted: int8 on CPU "
+            "(quantized INT8 weights/GEMMs, ~2x less memory), float16 on GPU. "
+            "int8_float16 is a lower-VRAM option for GPUs."
+        ),
+    )
+    p.add_argument(
+        "--device-index",
+        type=_parse_device_index,
+        default=[0],
+        help=(
+            "GPU index, or a comma-separated list (e.g. 0,1) to load a model replica on each GPU "
+            "(default: 0). The CLI transcribes one file with a single call, so extra GPUs only add "
+            "memory use, not speed."
+        ),
+    )
+    p.add_argument(
+        "--num-workers",
+        type=_positive_int,
+        default=1,
+        help=(
+            "Number of concurrent transcriptions the model can serve (CTranslate2 num_workers, "
+            "default: 1). The CLI makes a single call, so values above 1 only add memory use."
+        ),
     )
     p.add_argument("--beam-size", type=int, default=5, help="Beam size (default: 5)")
     p.add_argument("--no-vad", action="store_true", help="Disable VAD filter")
+    p.add_argument(
+        "--batched",
+        action="store_true",
+        help=(
+            "Use faster-whisper's batched pipeline (decodes several VAD chunks at once; best on GPU). "
+            "Requires VAD, so it can't be combined with --no-vad."
+        ),
+    )
+    p.add_argument("--batch-size", type=_positive_int, default=8, help="Chunks per batch with --batched (default: 8)")
     p.add_argument("--keep-wav", action="store_true", help="Keep extracted wav next to outputs")
     return p
 
 
 def main(argv: list[str] | None = None) -> int:
-    args = build_parser().parse_args(argv)
-
-    input_path = Path(args.input).expanduser().resolve()
-    outdir = Path(args.outdir).expanduser().resolve()
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.batched and args.no_vad:
+        parser.error("--batched requires VAD; it can't be combined with --no-vad")
 
+    # `transcribe_media_to_outputs` expands and resolves both paths once.
     transcribe_media_to_outputs(
-        input_path=input_path,
-        outdir=outdir,
+        input_path=Path(args.input),
+        outdir=Path(args.outdir),
         model=args.model,
         language=args.language,
         device=args.device,
         compute_type=args.compute_type,
+        device_index=args.device_index,
+        num_workers=args.num_workers,
         beam_size=args.beam_size,
         vad_filter=(not args.no_vad),
+        batched=args.batched,
+        batch_size=args.batch_size,
         keep_wav=args.keep_wav,
     )
     return 0
@@ -1,13 +1,26 @@
 from __future__ import annotations
 
+import functools
+import os
 import shutil
 import subprocess
-import time
+import threading
+import wave
+from collections import deque
+from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
+from typing import TYPE_CHECKING, Iterator
 
 from transcriber.errors import CancelledError
 
+if TYPE_CHECKING:
+    import numpy as np
+
+_PCM_READ_CHUNK_BYTES = 1 << 20
+_CANCEL_CHECK_INTERVAL_S = 0.5
+_STDERR_TAIL_LINES = 200
+
 
 @dataclass(frozen=True)
 class FfmpegResult:
@@ -22,9 +35,11 @@ class FfmpegFailedError(RuntimeError):
     pass
 
 
+@functools.lru_cache(maxsize=1)
 def ensure_ffmpeg_available() -> str:
     """
     Returns the ffmpeg executable path if available, otherwise raises.
+    The PATH lookup is cached after the first success.
     """
     ffmpeg = shutil.which("ffmpeg")
     if not ffmpeg:
@@ -39,6 +54,166 @@ def ensure_ffmpeg_available() -> str:
     return ffmpeg
 
 
+def _input_args(ffmpeg: str, input_path: Path) -> list[str]:
+    """
+    Shared argv prefix for every extraction: quiet ffmpeg reading `input_path`, audio only.
+    """
+    return [
+        ffmpeg,
+        "-hide_banner",
+        "-nostdin",
+        "-loglevel",
+        "error",
+        "-threads",
+        "0",  # let the decoder use all cores
+        "-i",
+        os.fspath(input_path),
+        # No video: the video stream is demuxed but never decoded, so hardware decode
+        # (`-hwaccel`) would have nothing to accelerate here.
+        "-vn",
+    ]
+
+
+@functools.lru_cache
+def _soxr_available(ffmpeg: str) -> bool:
+    """
+    Whether this ffmpeg build was compiled with libsoxr (checked once per executable).
+    """
+    try:
+        proc = subprocess.run([ffmpeg, "-hide_banner", "-buildconf"], capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return False
+    return "--enable-libsoxr" in proc.stdout
+
+
+def _resample_args(ffmpeg: str) -> list[str]:
+    """
+    Prefer the SIMD soxr resampler when available; otherwise keep ffmpeg's default (swr).
+    """
+    if _soxr_available(ffmpeg):
+        return ["-af", "aresample=resampler=soxr:precision=20"]
+    return []
+
+
+def _is_cancelled(cancel_event: object | None) -> bool:
+    return bool(cancel_event) and bool(getattr(cancel_event, "is_set", lambda: False)())
+
+
+def _terminate(proc: subprocess.Popen) -> None:
+    # Best-effort termination.
+    try:
+        proc.terminate()
+        proc.wait(timeout=2)
+    except Exception:  # noqa: BLE001
+        try:
+            proc.kill()
+        except Exception:  # noqa: BLE001
+            pass
+
+
+def _watch_for_cancel(proc: subprocess.Popen, cancel_event: object, done: threading.Event) -> None:
+    wait = getattr(cancel_event, "wait", None)
+    while not done.is_set():
+        if callable(wait):
+            # threading.Event: sleep until it fires (re-checking `done` periodically).
+            fired = wait(_CANCEL_CHECK_INTERVAL_S)
+        else:
+            done.wait(_CANCEL_CHECK_INTERVAL_S)
+            fired = _is_cancelled(cancel_event)
+        if fired and not done.is_set():
+            _terminate(proc)
+            return
+
+
+@contextmanager
+def _terminate_on_cancel(proc: subprocess.Popen, cancel_event: object | None) -> Iterator[None]:
+    """
+    Kill `proc` from a watchdog thread if `cancel_event` fires while the block is running,
+    so the caller can simply block on the process instead of polling it.
+    """
+    if cancel_event is None:
+        yield
+        return
+
+    done = threading.Event()
+    watchdog = threading.Thread(target=_watch_for_cancel, args=(proc, cancel_event, done), daemon=True)
+    watchdog.start()
+    try:
+        yield
+    finally:
+        done.set()
+
+
+@contextmanager
+def _ffmpeg_process(cmd: list[str], *, stdout: int) -> Iterator[tuple[subprocess.Popen, deque[str]]]:
+    """
+    Run ffmpeg with stderr drained on a background thread, keeping only the last lines for
+    error messages (draining also keeps a chatty decoder from filling the pipe and stalling).
+    On exit the pipes are closed and the process reaped; if the block raised, ffmpeg is
+    terminated first.
+    """
+    tail: deque[str] = deque(maxlen=_STDERR_TAIL_LINES)
+
+    with subprocess.Popen(cmd, stdout=stdout, stderr=subprocess.PIPE) as proc:
+
+        def _read() -> None:
+            assert proc.stderr is not None
+            for line in proc.stderr:
+                tail.append(line.decode("utf-8", errors="replace"))
+
+        reader = threading.Thread(target=_read, daemon=True)
+        reader.start()
+        try:
+            yield proc, tail
+        except BaseException:
+            _terminate(proc)
+            raise
+        finally:
+            # ffmpeg has exited (or been terminated), so stderr is at EOF.
+            reader.join()
+
+
+def _is_asr_ready_wav(path: Path, sample_rate_hz: int, channels: int = 1) -> bool:
+    """
+    True if `path` is already an uncompressed 16-bit PCM WAV with the requested rate/channels,
+    i.e. running it through ffmpeg would only copy the samples.
+    """
+    try:
+        with wave.open(os.fspath(path), "rb") as w:
+            return (w.getcomptype(), w.getsampwidth(), w.getframerate(), w.getnchannels()) == (
+                "NONE",
+                2,
+                sample_rate_hz,
+                channels,
+            )
+    except (wave.Error, EOFError, OSError):
+        # Not a (readable) WAV, or one the stdlib can't parse (e.g. WAVE_FORMAT_EXTENSIBLE):
+        # let ffmpeg handle it and report any error.
+        return False
+
+
+def _write_pcm16_wav(path: Path, pcm: bytes | bytearray, sample_rate_hz: int) -> None:
+    """
+    Write mono s16le PCM as a WAV in one sequential pass: the header sizes are known up front,
+    so nothing has to seek back and patch it afterwards.
+    The data goes to a temp file next to `path` (same filesystem) and is renamed into place,
+    so a failed write never leaves a truncated WAV behind.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.part")
+    try:
+        with wave.open(os.fspath(tmp_path), "wb") as w:
+            w.setnchannels(1)
+            w.setsampwidth(2)
+            w.setframerate(sample_rate_hz)
+            w.setnframes(len(pcm) // 2)
+            w.writeframes(pcm)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    os.replace(tmp_path, path)
+
+
 def extract_audio_to_wav(
     *,
     input_path: Path,
@@ -49,59 +224,128 @@ def extract_audio_to_wav(
 ) -> FfmpegResult:
     """
     Extract audio from a video file to a PCM WAV suitable for ASR (mono, 16kHz).
+    If `input_path` already is such a WAV, ffmpeg is skipped and the result points at `input_path`.
     """
-    ffmpeg = ensure_ffmpeg_available()
+    # Callers pass already-resolved paths (see `transcribe_media_to_outputs`).
+    assert input_path.is_absolute() and output_wav_path.is_absolute()
+
+    if _is_asr_ready_wav(input_path, sample_rate_hz, channels):
+        return FfmpegResult(wav_path=input_path)
 
-    input_path = input_path.expanduser().resolve()
-    output_wav_path = output_wav_path.expanduser().resolve()
+    ffmpeg = ensure_ffmpeg_available()
     output_wav_path.parent.mkdir(parents=True, exist_ok=True)
 
     cmd = [
-        ffmpeg,
-        "-hide_banner",
-        "-nostdin",
-        "-loglevel",
-        "error",
+        *_input_args(ffmpeg, input_path),
         "-y",  # overwrite output
-        "-i",
-        str(input_path),
-        "-vn",  # no video
         "-ac",
         str(channels),
         "-ar",
         str(sample_rate_hz),
         "-c:a",
         "pcm_s16le",
-        str(output_wav_path),
+        *_resample_args(ffmpeg),
+        os.fspath(output_wav_path),
     ]
 
-    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-
-    def _cancelled() -> bool:
-        return bool(cancel_event) and bool(getattr(cancel_event, "is_set", lambda: False)())
-
-    while proc.poll() is None:
-        if _cancelled():
-            # Best-effort termination.
-            try:
-                proc.terminate()
-                proc.wait(timeout=2)
-            except Exception:  # noqa: BLE001
-                try:
-                    proc.kill()
-                except Exception:  # noqa: BLE001
-                    pass
-            raise CancelledError("Cancelled while extracting audio.")
-        time.sleep(0.1)
+    with _ffmpeg_process(cmd, stdout=subprocess.DEVNULL) as (proc, stderr_tail):
+        with _terminate_on_cancel(proc, cancel_event):
+            proc.wait()
 
-    stdout, stderr = proc.communicate()
     if proc.returncode != 0:
+        if _is_cancelled(cancel_event):
+            raise CancelledError("Cancelled while extracting audio.")
         raise FfmpegFailedError(
             "ffmpeg failed to extract audio.\n"
             f"Command: {' '.join(cmd)}\n"
-            f"stderr:\n{stderr}"
+            f"stderr:\n{''.join(stderr_tail)}"
         )
 
     return FfmpegResult(wav_path=output_wav_path)
 
 
+def _decode_to_pcm16(*, input_path: Path, sample_rate_hz: int, cancel_event: object | None) -> bytearray:
+    """
+    Run ffmpeg and collect its mono s16le output from stdout.
+    """
+    ffmpeg = ensure_ffmpeg_available()
+
+    cmd = [
+        *_input_args(ffmpeg, input_path),
+        "-f",
+        "s16le",
+        "-acodec",
+        "pcm_s16le",
+        "-ac",
+        "1",
+        "-ar",
+        str(sample_rate_hz),
+        *_resample_args(ffmpeg),
+        "pipe:1",
+    ]
+
+    buf = bytearray()
+    with _ffmpeg_process(cmd, stdout=subprocess.PIPE) as (proc, stderr_tail):
+        assert proc.stdout is not None
+        with _terminate_on_cancel(proc, cancel_event):
+            while chunk := proc.stdout.read(_PCM_READ_CHUNK_BYTES):
+                buf += chunk
+            proc.wait()
+
+    if proc.returncode != 0:
+        if _is_cancelled(cancel_event):
+            raise CancelledError("Cancelled while extracting audio.")
+        raise FfmpegFailedError(
+            "ffmpeg failed to extract audio.\n"
+            f"Command: {' '.join(cmd)}\n"
+            f"stderr:\n{''.join(stderr_tail)}"
+        )
+
+    return buf
+
+
+def extract_audio_to_pcm_ndarray(
+    *,
+    input_path: Path,
+    sample_rate_hz: int = 16_000,
+    wav_copy_path: Path | None = None,
+    cancel_event: object | None = None,
+) -> np.ndarray:
+    """
+    Decode audio from a media file straight into memory as mono float32 samples in [-1, 1).
+
+    ffmpeg streams raw s16le PCM over stdout, so no intermediate WAV is written to disk
+    (and inputs that already are mono 16-bit WAVs at `sample_rate_hz` are read directly).
+    The returned array can be handed to faster-whisper as-is.
+    If `wav_copy_path` is given, the same PCM is also saved there as a WAV (no second decode).
+    """
+    # Lazy import so simply importing the package/GUI is lightweight.
+    import numpy as np
+
+    assert input_path.is_absolute()
+
+    asr_ready = _is_asr_ready_wav(input_path, sample_rate_hz)
+    if wav_copy_path == input_path and not asr_ready:
+        # Saving the extracted audio there would overwrite the original input.
+        raise ValueError(
+            f"Cannot save the extracted WAV to {wav_copy_path}: that is the input file. "
+            "Choose a different output directory."
+        )
+
+    pcm: bytes | bytearray
+    if asr_ready:
+        with wave.open(os.fspath(input_path), "rb") as w:
+            pcm = w.readframes(w.getnframes())
+    else:
+        pcm = _decode_to_pcm16(input_path=input_path, sample_rate_hz=sample_rate_hz, cancel_event=cancel_event)
+
+    # A truncated file/stream can end mid-sample; drop the partial sample.
+    if len(pcm) % 2:
+        pcm = pcm[:-1]
+
+    if wav_copy_path is not None and wav_copy_path != input_path:
+        _write_pcm16_wav(wav_copy_path, pcm, sample_rate_hz)
+
+    samples = np.frombuffer(pcm, dtype=np.int16).astype(np.float32)
+    samples /= 32768.0
+    return samples
@@ -1,15 +1,25 @@
 from __future__ import annotations
 
 import json
-import tempfile
+import threading
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Callable
+from typing import TYPE_CHECKING, Any, Callable, Iterable
 
 from transcriber.errors import CancelledError
-from transcriber.ffmpeg_utils import extract_audio_to_wav
+from transcriber.ffmpeg_utils import extract_audio_to_pcm_ndarray
 from transcriber.utils import sanitize_filename_component
 
+try:  # Optional: faster JSON encoding for long transcripts.
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from transcriber.transcribe import LoadedModel, TranscriptionSegment
+
 
 @dataclass(frozen=True)
 class TranscriptionOutputs:
@@ -28,18 +38,26 @@ def transcribe_media_to_outputs(
     language: str = "en",
     device: str = "auto",
     compute_type: str | None = None,
+    device_index: int | list[int] = 0,
+    num_workers: int = 1,
     beam_size: int = 5,
     vad_filter: bool = True,
+    batched: bool = False,
+    batch_size: int = 8,
     keep_wav: bool = False,
     on_log: Callable[[str], None] | None = None,
     cancel_event: object | None = None,
 ) -> TranscriptionOutputs:
     """
     End-to-end pipeline:
-    - Extract audio with ffmpeg
+    - Extract audio with ffmpeg into memory (also saved as a WAV next to the outputs with `keep_wav`)
     - Transcribe with faster-whisper
     - Write `*.segments.json` and `*.timestamps.txt`
     """
+    if batched and not vad_filter:
+        # Checked up front so we don't extract audio and load a model only to fail.
+        raise ValueError("Batched transcription requires the VAD filter (vad_filter=True).")
+
     input_path = input_path.expanduser().resolve()
     outdir = outdir.expanduser().resolve()
     outdir.mkdir(parents=True, exist_ok=True)
@@ -57,53 +75,42 @@ def transcribe_media_to_outputs(
         return bool(cancel_event) and bool(getattr(cancel_event, "is_set", lambda: False)())
 
     log(f"Input: {input_path.name}")
+
+    if cancelled():
+        raise CancelledError("Cancelled.")
+
+    # Model loading doesn't depend on the audio, so run it alongside ffmpeg.
+    log(f"Loading model '{model}'…")
+    model_loader = _ModelLoader(
+        model=model,
+        device=device,
+        compute_type=compute_type,
+        device_index=device_index,
+        num_workers=num_workers,
+    )
+
     log("Extracting audio with ffmpeg…")
+    audio = extract_audio_to_pcm_ndarray(
+        input_path=input_path,
+        wav_copy_path=(kept_wav_path if keep_wav else None),
+        cancel_event=cancel_event,
+    )
+
+    loaded_model = model_loader.result(cancelled)
 
-    wav_path: Path | None = None
-    if keep_wav:
-        if cancelled():
-            raise CancelledError("Cancelled.")
-        wav_path = kept_wav_path
-        extract_audio_to_wav(input_path=input_path, output_wav_path=wav_path, cancel_event=cancel_event)
-        _transcribe_wav_and_write_outputs(
-            wav_path=wav_path,
-            model=model,
-            language=language,
-            device=device,
-            compute_type=compute_type,
-            beam_size=beam_size,
-            vad_filter=vad_filter,
-            segments_json_path=segments_json_path,
-            timestamps_txt_path=timestamps_txt_path,
-            on_log=on_log,
-            cancel_event=cancel_event,
-        )
-        return TranscriptionOutputs(
-            base_name=base,
-            outdir=outdir,
-            segments_json_path=segments_json_path,
-            timestamps_txt_path=timestamps_txt_path,
-            wav_path=wav_path,
-        )
-
-    with tempfile.TemporaryDirectory(prefix="transcriber-") as td:
-        if cancelled():
-            raise CancelledError("Cancelled.")
-        wav_path = Path(td) / f"{base}.wav"
-        extract_audio_to_wav(input_path=input_path, output_wav_path=wav_path, cancel_event=cancel_event)
-        _transcribe_wav_and_write_outputs(
-            wav_path=wav_path,
-            model=model,
-            language=language,
-            device=device,
-            compute_type=compute_type,
-            beam_size=beam_size,
-            vad_filter=vad_filter,
-            segments_json_path=segments_json_path,
-            timestamps_txt_path=timestamps_txt_path,
-            on_log=on_log,
-            cancel_event=cancel_event,
-        )
+    _transcribe_audio_and_write_outputs(
+        audio=audio,
+        loaded_model=loaded_model,
+        language=language,
+        beam_size=beam_size,
+        vad_filter=vad_filter,
+        batched=batched,
+        batch_size=batch_size,
+        segments_json_path=segments_json_path,
+        timestamps_txt_path=timestamps_txt_path,
+        on_log=on_log,
+        cancel_event=cancel_event,
+    )
 
     return TranscriptionOutputs(
         base_name=base,
@@ -114,22 +121,80 @@ def transcribe_media_to_outputs(
     )
 
 
-def _transcribe_wav_and_write_outputs(
+class _ModelLoader:
+    """
+    Loads the model on a daemon thread. If extraction fails or is cancelled, nothing waits for
+    the load (not even interpreter exit); it just finishes, or dies with the process, in the background.
+    """
+
+    _POLL_INTERVAL_S = 0.5
+
+    def __init__(self, **build_kwargs: Any) -> None:
+        self._done = threading.Event()
+        self._model: LoadedModel | None = None
+        self._error: BaseException | None = None
+        threading.Thread(target=self._run, kwargs=build_kwargs, name="transcriber-model", daemon=True).start()
+
+    def _run(self, **build_kwargs: Any) -> None:
+        try:
+            self._model = _build_model(**build_kwargs)
+        except BaseException as e:  # noqa: BLE001 - re-raised on the caller's thread
+            self._error = e
+        finally:
+            self._done.set()
+
+    def result(self, cancelled: Callable[[], bool]) -> LoadedModel:
+        """
+        Wait for the model, raising `CancelledError` as soon as `cancelled()` turns true.
+        """
+        while True:
+            if cancelled():
+                raise CancelledError("Cancelled.")
+            if self._done.wait(self._POLL_INTERVAL_S):
+                break
+        if self._error is not None:
+            raise self._error
+        assert self._model is not None
+        return self._model
+
+
+def _build_model(
     *,
-    wav_path: Path,
     model: str,
-    language: str,
     device: str,
     compute_type: str | None,
+    device_index: int | list[int],
+    num_workers: int,
+) -> LoadedModel:
+    # Lazy import so simply importing the package/GUI is lightweight
+    # (and so importing faster-whisper also overlaps with audio extraction).
+    from transcriber.transcribe import load_model
+
+    return load_model(
+        model_name=model,
+        device=device,
+        compute_type=compute_type,
+        device_index=device_index,
+        num_workers=num_workers,
+    )
+
+
+def _transcribe_audio_and_write_outputs(
+    *,
+    audio: np.ndarray,
+    loaded_model: LoadedModel,
+    language: str,
     beam_size: int,
     vad_filter: bool,
+    batched: bool,
+    batch_size: int,
     segments_json_path: Path,
     timestamps_txt_path: Path,
     on_log: Callable[[str], None] | None,
     cancel_event: object | None,
 ) -> None:
     # Lazy import so simply importing the package/GUI is lightweight.
-    from transcriber.transcribe import format_timestamp, transcribe_wav
+    from transcriber.transcribe import format_timestamps, transcribe_audio
 
     if cancel_event and getattr(cancel_event, "is_set", lambda: False)():
         raise CancelledError("Cancelled.")
@@ -137,14 +202,14 @@ def _transcribe_wav_and_write_outputs(
     if on_log:
         on_log("Transcribing… (this may take a while on first run)")
 
-    result = transcribe_wav(
-        wav_path=wav_path,
-        model_name=model,
+    result = transcribe_audio(
+        audio=audio,
+        loaded_model=loaded_model,
         language=language,
-        device=device,
-        compute_type=compute_type,
         beam_size=beam_size,
         vad_filter=vad_filter,
+        batched=batched,
+        batch_size=batch_size,
         cancel_event=cancel_event,
     )
 
@@ -157,33 +222,48 @@ def _transcribe_wav_and_write_outputs(
     if cancel_event and getattr(cancel_event, "is_set", lambda: False)():
         raise CancelledError("Cancelled.")
 
-    payload = {
-        "info": result.info,
-        "segments": [
-            {
-                "start": s.start,
-                "end": s.end,
-                "text": s.text,
-                "avg_logprob": s.avg_logprob,
-                "no_speech_prob": s.no_speech_prob,
-                "compression_ratio": s.compression_ratio,
-            }
-            for s in result.segments
-        ],
-    }
-
-    segments_json_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
-
-    lines: list[str] = []
-    for s in result.segments:
-        if not s.text:
-            continue
-        start = format_timestamp(s.start)
-        end = format_timestamp(s.end)
-        lines.append(f"[{start} --> {end}] {s.text}")
-
-    timestamps_txt_path.write_text("\n".join(lines) + ("\n" if lines else ""), encoding="utf-8")
+    _write_segments_json(segments_json_path, result.info, result.segments)
+
+    spoken = [s for s in result.segments if s.text]
+    starts = format_timestamps(s.start for s in spoken)
+    ends = format_timestamps(s.end for s in spoken)
+    with timestamps_txt_path.open("w", encoding="utf-8", buffering=1 << 16) as f:
+        for s, start, end in zip(spoken, starts, ends):
+            f.write(f"[{start} --> {end}] {s.text}\n")
 
     if on_log:
         on_log("Done.")
 
+
+def _dumps(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    # Compact separators to match orjson's layout. Number formatting can still differ
+    # (e.g. orjson writes 1e-05 as 0.00001 and NaN as null, where the stdlib writes NaN).
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _write_segments_json(path: Path, info: dict[str, Any], segments: Iterable[TranscriptionSegment]) -> None:
+    """
+    Stream `{"info": ..., "segments": [...]}` to `path` one segment (one line) at a time,
+    instead of building the whole payload in memory before encoding it.
+    """
+    with path.open("wb") as f:
+        f.write(b'{\n  "info": ' + _dumps(info) + b',\n  "segments": [')
+        first = True
+        for s in segments:
+            f.write(b"\n    " if first else b",\n    ")
+            first = False
+            f.write(
+                _dumps(
+                    {
+                        "start": s.start,
+                        "end": s.end,
+                        "text": s.text,
+                        "avg_logprob": s.avg_logprob,
+                        "no_speech_prob": s.no_speech_prob,
+                        "compression_ratio": s.compression_ratio,
+                    }
+                )
+            )
+        f.write(b"]\n}\n" if first else b"\n  ]\n}\n")
@@ -5,7 +5,8 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Iterable
 
-from faster_whisper import WhisperModel
+import numpy as np
+from faster_whisper import BatchedInferencePipeline, WhisperModel
 
 from transcriber.errors import CancelledError
 
@@ -43,6 +44,8 @@ def _init_model_with_fallback(
     model_name: str,
     device: str,
     compute_type: str | None,
+    device_index: int | list[int] = 0,
+    num_workers: int = 1,
 ) -> tuple[WhisperModel, str, str]:
     """
     Initialize faster-whisper model, supporting device='auto' which prefers GPU if present.
@@ -52,7 +55,14 @@ def _init_model_with_fallback(
 
     def _try_init(d: str) -> tuple[WhisperModel, str, str]:
         ct = compute_type if compute_type is not None else _default_compute_type_for_device(d)
-        return WhisperModel(model_name, device=d, compute_type=ct), d, ct
+        model = WhisperModel(
+            model_name,
+            device=d,
+            device_index=device_index,
+            compute_type=ct,
+            num_workers=num_workers,
+        )
+        return model, d, ct
 
     if requested_device != "auto":
         return _try_init(requested_device)
@@ -77,6 +87,37 @@ def _init_model_with_fallback(
     raise RuntimeError("Failed to initialize WhisperModel on any backend") from last_err
 
 
+@dataclass(frozen=True)
+class LoadedModel:
+    model: WhisperModel
+    model_name: str
+    device: str
+    compute_type: str
+
+
+def load_model(
+    *,
+    model_name: str = "small",
+    device: str = "auto",
+    compute_type: str | None = None,
+    device_index: int | list[int] = 0,
+    num_workers: int = 1,
+) -> LoadedModel:
+    """
+    Load a faster-whisper model ahead of transcription, e.g. while audio is still being extracted.
+    A list `device_index` spreads work across several GPUs; `num_workers` allows that many
+    concurrent `transcribe()` calls on the one model (see CTranslate2's multi-device docs).
+    """
+    model, device_used, compute_type_used = _init_model_with_fallback(
+        model_name=model_name,
+        device=device,
+        compute_type=compute_type,
+        device_index=device_index,
+        num_workers=num_workers,
+    )
+    return LoadedModel(model=model, model_name=model_name, device=device_used, compute_type=compute_type_used)
+
+
 def transcribe_wav(
     *,
     wav_path: Path,
@@ -84,27 +125,95 @@ def transcribe_wav(
     language: str = "en",
     device: str = "auto",
     compute_type: str | None = None,
+    device_index: int | list[int] = 0,
+    num_workers: int = 1,
     beam_size: int = 5,
     vad_filter: bool = True,
+    batched: bool = False,
+    batch_size: int = 8,
+    loaded_model: LoadedModel | None = None,
     cancel_event: object | None = None,
 ) -> TranscriptionResult:
     """
-    Run local transcription using faster-whisper and return timestamped segments.
+    Transcribe a WAV file on disk. See `transcribe_audio` for the options.
     """
-    wav_path = wav_path.expanduser().resolve()
-
-    model, device_used, compute_type_used = _init_model_with_fallback(
+    return transcribe_audio(
+        audio=wav_path,
         model_name=model_name,
+        language=language,
         device=device,
         compute_type=compute_type,
-    )
-    segments_iter, info = model.transcribe(
-        str(wav_path),
-        language=language,
+        device_index=device_index,
+        num_workers=num_workers,
         beam_size=beam_size,
         vad_filter=vad_filter,
+        batched=batched,
+        batch_size=batch_size,
+        loaded_model=loaded_model,
+        cancel_event=cancel_event,
     )
 
+
+def transcribe_audio(
+    *,
+    audio: Path | np.ndarray,
+    model_name: str = "small",
+    language: str = "en",
+    device: str = "auto",
+    compute_type: str | None = None,
+    device_index: int | list[int] = 0,
+    num_workers: int = 1,
+    beam_size: int = 5,
+    vad_filter: bool = True,
+    batched: bool = False,
+    batch_size: int = 8,
+    loaded_model: LoadedModel | None = None,
+    cancel_event: object | None = None,
+) -> TranscriptionResult:
+    """
+    Run local transcription using faster-whisper and return timestamped segments.
+
+    `audio` is either a path to a media file or mono 16kHz float32 samples
+    (see `extract_audio_to_pcm_ndarray`).
+    With `batched`, chunks are decoded `batch_size` at a time (much faster on GPU);
+    it needs `vad_filter` to split the audio into chunks.
+    Pass `loaded_model` (from `load_model`) to reuse a model; `model_name`/`device`/`compute_type`/
+    `device_index`/`num_workers` are then ignored.
+    """
+    if batched and not vad_filter:
+        raise ValueError("Batched transcription requires the VAD filter (vad_filter=True).")
+
+    if isinstance(audio, Path):
+        audio = str(audio.expanduser().resolve())
+
+    if loaded_model is None:
+        loaded_model = load_model(
+            model_name=model_name,
+            device=device,
+            compute_type=compute_type,
+            device_index=device_index,
+            num_workers=num_workers,
+        )
+    model = loaded_model.model
+
+    if batched:
+        segments_iter, info = BatchedInferencePipeline(model).transcribe(
+            audio,
+            language=language,
+            beam_size=beam_size,
+            vad_filter=vad_filter,
+            batch_size=batch_size,
+            # Keep per-segment timestamps; the batched default is one segment per VAD chunk (up to 30s).
+            without_timestamps=False,
+        )
+    else:
+        segments_iter, info = model.transcribe(
+            audio,
+            language=language,
+            beam_size=beam_size,
+            vad_filter=vad_filter,
+        )
+
     segments: list[TranscriptionSegment] = []
     for seg in _iter_segments(segments_iter):
         if cancel_event and getattr(cancel_event, "is_set", lambda: False)():
@@ -138,11 +247,13 @@ def transcribe_wav(
         if hasattr(info, key):
             info_dict[key] = getattr(info, key)
 
-    info_dict["model_name"] = model_name
-    info_dict["device"] = device_used
-    info_dict["compute_type"] = compute_type_used
+    info_dict["model_name"] = loaded_model.model_name
+    info_dict["device"] = loaded_model.device
+    info_dict["compute_type"] = loaded_model.compute_type
     info_dict["beam_size"] = beam_size
     info_dict["vad_filter"] = vad_filter
+    if batched:
+        info_dict["batch_size"] = batch_size
 
     return TranscriptionResult(segments=segments, info=info_dict)
 
@@ -168,3 +279,13 @@ def format_timestamp(seconds: float) -> str:
     return f"{h:02d}:{m:02d}:{s:02d}.{ms:03d}"
 
 
+def format_timestamps(seconds: Iterable[float]) -> list[str]:
+    """
+    Vectorized `format_timestamp` for many values at once (same rounding and output).
+    """
+    arr = np.fromiter(seconds, dtype=np.float64)
+    total_ms = np.rint(np.maximum(arr, 0.0) * 1000.0).astype(np.int64)
+    total_s, ms = np.divmod(total_ms, 1000)
+    total_m, s = np.divmod(total_s, 60)
+    h, m = np.divmod(total_m, 60)
+    return [f"{hh:02d}:{mm:02d}:{ss:02d}.{xx:03d}" for hh, mm, ss, xx in np.stack([h, m, s, ms], axis=1).tolist()]
@@ -10,6 +10,9 @@ _WINDOWS_RESERVED_NAMES = {
     *(f"LPT{i}" for i in range(1, 10)),
 }
 
+# Windows-forbidden characters (plus NUL), all mapped to underscores.
+_SANITIZE_TABLE = str.maketrans({c: "_" for c in '<>:"/\\|?*\x00'})
+
 
 def sanitize_filename_component(name: str) -> str:
     """
@@ -17,8 +20,7 @@ def sanitize_filename_component(name: str) -> str:
     - Windows forbids: <>:"/\\|?* and NUL, plus trailing dots/spaces and reserved names.
     """
     # Replace Windows-forbidden characters with underscores.
-    cleaned = "".join("_" if c in '<>:"/\\|?*' else c for c in name)
-    cleaned = cleaned.replace("\x00", "_")
+    cleaned = name.translate(_SANITIZE_TABLE)
 
     # Windows doesn't allow trailing spaces/dots.
     cleaned = cleaned.rstrip(" .")